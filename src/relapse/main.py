@@ -2,33 +2,59 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+import bisect
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+import errno
+import functools
+import heapq
+from itertools import islice
+from operator import attrgetter
+import os
 from pathlib import Path
-import shutil
-import subprocess
+import stat
 import sys
-import tarfile
 import time
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import subprocess
+    import tarfile
+
 
 @dataclass
 class Batch:
-    paths: list[Path]
+    source: list[str]
+    indices: list[int]
     max_ts: float
     min_ts: float
 
+    @property
+    def paths(self) -> list[str]:
+        return [self.source[i] for i in self.indices]
+
+
+@dataclass
+class BatchIndex:
+    batches: list[Batch]
+    keys: list[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.keys = [-batch.min_ts for batch in self.batches]
+
 
 @dataclass(frozen=True)
 class SelectedFile:
-    absolute: Path
-    relative: Path
+    absolute: str
+    relative: str
 
 
 @dataclass(frozen=True)
 class FileRecord:
-    absolute: Path
-    relative: Path
+    absolute: str
+    relative: str
     mtime: float
 
 
@@ -54,63 +80,217 @@ def parse_datetime(value: str) -> datetime:
     return dt
 
 
-def collect_files(root: Path) -> list[tuple[Path, float]]:
-    files: list[tuple[Path, float]] = []
-    for path in root.rglob("*"):
-        try:
-            if not path.is_file():
-                continue
-            stat = path.stat()
-        except (FileNotFoundError, PermissionError):
-            continue
-        files.append((path.resolve(), stat.st_mtime))
-    return files
+def _scan_dir(
+    path: str, with_files: bool = True
+) -> tuple[list[str], list[float], list[str]]:
+    paths: list[str] = []
+    mtimes: list[float] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif with_files and entry.is_file(follow_symlinks=False):
+                        mtime = entry.stat().st_mtime
+                        paths.append(entry.path)
+                        mtimes.append(mtime)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return paths, mtimes, subdirs
+
+
+def collect_files(
+    root: Path, filter_value: str = "all"
+) -> tuple[list[str], list[float]]:
+    abs_root = str(root.resolve())
+    if os.path.basename(abs_root) == "docs":
+        if filter_value == "code":
+            return [], []
+        filter_value = "all"
+
+    paths, mtimes, subdirs = _scan_dir(abs_root, with_files=filter_value != "docs")
+    if filter_value != "all":
+        docs_root = docs_prefix(abs_root)
+        subdirs = [
+            path
+            for path in subdirs
+            if classify_path(os.path.join(path, ""), docs_root) == filter_value
+        ]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_dir, path) for path in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_paths, dir_mtimes, subdirs = future.result()
+                paths.extend(dir_paths)
+                mtimes.extend(dir_mtimes)
+                pending.update(executor.submit(_scan_dir, path) for path in subdirs)
+    return paths, mtimes
+
+
+_CACHE_VERSION = 2
+
+
+def _cache_path(root: Path, filter_value: str) -> Path:
+    import hashlib
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    key = hashlib.blake2b(f"{root}\0{filter_value}".encode()).hexdigest()[:16]
+    return Path(base) / "relapse" / f"{key}.pkl"
+
+
+def _cache_stamp(root: Path) -> dict[str, float]:
+    stamp = {".": root.stat().st_mtime}
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stamp[entry.name] = entry.stat(follow_symlinks=False).st_mtime
+    return stamp
+
+
+def _load_cache(
+    root: Path, filter_value: str, stamp: dict[str, float]
+) -> tuple[list[str], list[float]] | None:
+    import pickle
 
+    try:
+        with _cache_path(root, filter_value).open("rb") as handle:
+            data = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return None
+    if data.get("root") != str(root) or data.get("filter") != filter_value:
+        return None
+    if data.get("stamp") != stamp:
+        return None
+    return data["paths"], data["mtimes"]
 
-def build_batches(files: list[tuple[Path, float]], max_gap: float) -> list[Batch]:
-    files.sort(key=lambda item: item[1], reverse=True)
-    batches: list[Batch] = []
-    for path, mtime in files:
-        if not batches:
-            batches.append(Batch(paths=[path], max_ts=mtime, min_ts=mtime))
-            continue
-        current = batches[-1]
-        gap = current.min_ts - mtime
-        if gap > max_gap:
-            batches.append(Batch(paths=[path], max_ts=mtime, min_ts=mtime))
+
+def _save_cache(
+    root: Path,
+    filter_value: str,
+    stamp: dict[str, float],
+    paths: list[str],
+    mtimes: list[float],
+) -> None:
+    import pickle
+
+    cache_path = _cache_path(root, filter_value)
+    data = {
+        "version": _CACHE_VERSION,
+        "root": str(root),
+        "filter": filter_value,
+        "stamp": stamp,
+        "paths": paths,
+        "mtimes": mtimes,
+    }
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def collect_files_cached(
+    root: Path, filter_value: str, use_cache: bool
+) -> tuple[list[str], list[float]]:
+    if not use_cache:
+        return collect_files(root, filter_value)
+    try:
+        stamp = _cache_stamp(root)
+    except OSError:
+        return collect_files(root, filter_value)
+    cached = _load_cache(root, filter_value, stamp)
+    if cached is not None:
+        return cached
+    paths, mtimes = collect_files(root, filter_value)
+    _save_cache(root, filter_value, stamp, paths, mtimes)
+    return paths, mtimes
+
+
+def _split_batches(
+    paths: list[str], mtimes: list[float], order: Iterator[int], max_gap: float
+) -> Iterator[Batch]:
+    current: Batch | None = None
+    for i in order:
+        mtime = mtimes[i]
+        if current is None:
+            current = Batch(paths, [i], mtime, mtime)
+        elif current.min_ts - mtime > max_gap:
+            yield current
+            current = Batch(paths, [i], mtime, mtime)
         else:
-            current.paths.append(path)
+            current.indices.append(i)
             current.min_ts = mtime
-    return batches
+    if current is not None:
+        yield current
+
+
+def _heap_order(mtimes: list[float]) -> Iterator[int]:
+    heap = [(-mtime, i) for i, mtime in enumerate(mtimes)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[1]
+
+
+def iter_batches(
+    paths: list[str], mtimes: list[float], max_gap: float
+) -> Iterator[Batch]:
+    return _split_batches(paths, mtimes, _heap_order(mtimes), max_gap)
 
 
-def choose_batch_by_datetime(batches: list[Batch], dt: datetime) -> Batch | None:
-    if not batches:
+def build_batches(
+    paths: list[str], mtimes: list[float], max_gap: float
+) -> list[Batch]:
+    order = sorted(range(len(mtimes)), key=mtimes.__getitem__, reverse=True)
+    return list(_split_batches(paths, mtimes, iter(order), max_gap))
+
+
+def choose_batch_by_datetime(index: BatchIndex, dt: datetime) -> Batch | None:
+    if not index.batches:
         return None
-    dt_ts = dt.timestamp()
-    for batch in batches:
-        if batch.min_ts <= dt_ts <= batch.max_ts:
-            return batch
-    if dt_ts >= batches[0].max_ts:
-        return batches[0]
-    for batch in batches:
-        if batch.max_ts <= dt_ts:
-            return batch
-    return batches[-1]
+    pos = bisect.bisect_left(index.keys, -dt.timestamp())
+    if pos == len(index.batches):
+        return index.batches[-1]
+    return index.batches[pos]
 
 
 def add_root_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--root",
         type=Path,
-        default=Path.cwd(),
+        default=Path("."),
         help="Root directory to scan (default: current directory).",
     )
     parser.add_argument(
         "--filter",
         choices=["all", "docs", "code"],
         default="all",
-        help="Filter selected files to docs or code (default: all).",
+        help=(
+            "Only consider docs or code files (default: all). The filter applies "
+            "before batching, so batches and batch indices count matching files "
+            "only."
+        ),
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse the file list cached under ~/.cache/relapse while the mtimes "
+            "of the root and its top-level directories are unchanged. File edits "
+            "anywhere, and files added or removed below the top level, are not "
+            "detected, so the cached batches can be stale."
+        ),
     )
 
 
@@ -148,6 +328,7 @@ def add_common_options(parser: argparse.ArgumentParser) -> None:
     add_root_options(parser)
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
@@ -271,23 +452,29 @@ def parse_selection_args(args: argparse.Namespace) -> tuple[int | None, datetime
     return batch_index, batch_datetime
 
 
-def classify_path(root: Path, relative: Path) -> str:
-    if root.name == "docs":
-        return "docs"
-    if relative.parts and relative.parts[0] == "docs":
-        return "docs"
-    return "code"
+def docs_prefix(root: Path | str) -> str:
+    if os.path.basename(root) == "docs":
+        return os.path.join(root, "")
+    return os.path.join(root, "docs", "")
+
+
+def classify_path(path: str, prefix: str) -> str:
+    return "docs" if path.startswith(prefix) else "code"
 
 
-def collect_records(root: Path, filter_value: str) -> list[FileRecord]:
-    files = collect_files(root)
+def collect_records(
+    root: Path, filter_value: str, use_cache: bool = False
+) -> list[FileRecord]:
+    paths, mtimes = collect_files_cached(root, filter_value, use_cache)
+    root_prefix = os.path.join(str(root), "")
+    root_len = len(root_prefix)
+    docs_root = docs_prefix(root)
     records: list[FileRecord] = []
-    for path, mtime in files:
-        try:
-            relative = path.relative_to(root)
-        except ValueError:
+    for path, mtime in zip(paths, mtimes):
+        if not path.startswith(root_prefix):
             continue
-        if filter_value != "all" and classify_path(root, relative) != filter_value:
+        relative = path[root_len:]
+        if filter_value != "all" and classify_path(path, docs_root) != filter_value:
             continue
         records.append(FileRecord(absolute=path, relative=relative, mtime=mtime))
     return records
@@ -300,47 +487,49 @@ def select_files(args: argparse.Namespace) -> Selection | None:
     if not root.exists():
         raise FileNotFoundError(f"Root does not exist: {root}")
 
-    files = collect_files(root)
-    if not files:
+    paths, mtimes = collect_files_cached(root, args.filter, args.cache)
+    if not paths:
         return None
 
-    batches = build_batches(files, args.max_gap_seconds)
-
     chosen: Batch | None
     if batch_datetime is not None:
-        chosen = choose_batch_by_datetime(batches, batch_datetime)
+        index = BatchIndex(build_batches(paths, mtimes, args.max_gap_seconds))
+        chosen = choose_batch_by_datetime(index, batch_datetime)
     else:
         idx = batch_index or 0
-        if idx >= len(batches):
+        batches = iter_batches(paths, mtimes, args.max_gap_seconds)
+        leading = list(islice(batches, idx + 1))
+        if idx >= len(leading):
             raise IndexError(
-                f"Requested batch {idx}, but only {len(batches)} batch(es) found."
+                f"Requested batch {idx}, but only {len(leading)} batch(es) found."
             )
-        chosen = batches[idx]
+        chosen = leading[idx]
 
     if chosen is None:
         return None
 
-    selected: dict[str, SelectedFile] = {}
+    root_prefix = os.path.join(str(root), "")
+    root_len = len(root_prefix)
+    docs_root = docs_prefix(root)
+    selected: list[SelectedFile] = []
     for path in chosen.paths:
-        try:
-            relative = path.relative_to(root)
-        except ValueError:
+        if not path.startswith(root_prefix):
             continue
-        if args.filter != "all" and classify_path(root, relative) != args.filter:
+        relative = path[root_len:]
+        if args.filter != "all" and classify_path(path, docs_root) != args.filter:
             continue
-        key = str(relative)
-        selected[key] = SelectedFile(absolute=path, relative=relative)
+        selected.append(SelectedFile(absolute=path, relative=relative))
 
-    ordered = [selected[key] for key in sorted(selected)]
-    return Selection(batch=chosen, files=ordered)
+    selected.sort(key=attrgetter("relative"))
+    return Selection(batch=chosen, files=selected)
 
 
 def format_path(selected: SelectedFile, fmt: str) -> str:
     if fmt == "absolute":
-        return str(selected.absolute)
+        return selected.absolute
     if fmt == "name":
-        return selected.absolute.name
-    return str(selected.relative)
+        return os.path.basename(selected.absolute)
+    return selected.relative
 
 
 def fuzzy_delta(seconds: float) -> str:
@@ -351,40 +540,40 @@ def fuzzy_delta(seconds: float) -> str:
         direction = "ago"
     if seconds < 60:
         return "just now"
-    minutes = seconds / 60
-    if minutes < 60:
-        return f"{round(minutes)}m {direction}"
-    hours = minutes / 60
-    if hours < 24:
-        return f"{round(hours)}h {direction}"
-    days = hours / 24
-    if days < 30:
-        return f"{round(days)}d {direction}"
-    months = days / 30
-    if months < 12:
-        return f"{round(months)}mo {direction}"
-    years = months / 12
-    return f"{round(years)}y {direction}"
-
-
-def format_human(dt: datetime) -> str:
-    now = datetime.now()
+    if seconds < 3600:
+        unit, size = "m", 60
+    elif seconds < 86400:
+        unit, size = "h", 3600
+    elif seconds < 2592000:
+        unit, size = "d", 86400
+    elif seconds < 31104000:
+        unit, size = "mo", 2592000
+    else:
+        unit, size = "y", 31104000
+    count = int(seconds // size + (seconds % size >= size / 2))
+    return f"{count}{unit} {direction}"
+
+
+def format_human(dt: datetime, now: datetime | None = None) -> str:
+    if now is None:
+        now = datetime.now()
     if dt.year != now.year:
         return dt.strftime("%b %d %Y %H:%M")
     return dt.strftime("%b %d %H:%M")
 
 
 def format_window(start_ts: float, end_ts: float) -> str:
+    now = time.time()
+    now_dt = datetime.fromtimestamp(now)
     start_dt = datetime.fromtimestamp(start_ts)
     end_dt = datetime.fromtimestamp(end_ts)
     if start_dt.date() == end_dt.date():
-        start_label = format_human(start_dt)
+        start_label = format_human(start_dt, now_dt)
         end_label = end_dt.strftime("%H:%M")
     else:
-        start_label = format_human(start_dt)
-        end_label = format_human(end_dt)
+        start_label = format_human(start_dt, now_dt)
+        end_label = format_human(end_dt, now_dt)
     duration = abs(end_ts - start_ts)
-    now = time.time()
     start_fuzzy = fuzzy_delta(now - start_ts)
     end_fuzzy = fuzzy_delta(now - end_ts)
     return f"{start_label}–{end_label} (≈{fuzzy_delta(duration)}; {start_fuzzy} to {end_fuzzy})"
@@ -402,56 +591,266 @@ def cmd_print(args: argparse.Namespace) -> int:
     return 0
 
 
+@functools.cache
+def _owner_names(uid: int, gid: int) -> tuple[str, str]:
+    try:
+        import grp
+        import pwd
+    except ModuleNotFoundError:
+        return "", ""
+    try:
+        uname = pwd.getpwuid(uid).pw_name
+    except KeyError:
+        uname = ""
+    try:
+        gname = grp.getgrgid(gid).gr_name
+    except KeyError:
+        gname = ""
+    return uname, gname
+
+
+def _make_tarinfo(relative: str, st: os.stat_result) -> tarfile.TarInfo:
+    import tarfile
+
+    info = tarfile.TarInfo(name=relative)
+    info.size = st.st_size
+    info.mtime = st.st_mtime
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.uid = st.st_uid
+    info.gid = st.st_gid
+    info.uname, info.gname = _owner_names(st.st_uid, st.st_gid)
+    return info
+
+
+_FICLONE = 0x40049409
+_COPY_CHUNK = 16 * 1024 * 1024
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _send_file(fd: int, src_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        try:
+            sent = os.sendfile(fd, src_fd, offset, size - offset)
+        except OSError as exc:
+            if exc.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            break
+        if sent == 0:
+            raise OSError("unexpected end of data")
+        offset += sent
+    while offset < size:
+        chunk = os.pread(src_fd, min(size - offset, _COPY_CHUNK), offset)
+        if not chunk:
+            raise OSError("unexpected end of data")
+        _write_all(fd, chunk)
+        offset += len(chunk)
+
+
+def _write_tar_stream(fd: int, files: list[SelectedFile]) -> None:
+    import tarfile
+
+    offset = 0
+    for item in files:
+        with open(item.absolute, "rb") as handle:
+            info = _make_tarinfo(item.relative, os.fstat(handle.fileno()))
+            header = info.tobuf()
+            _write_all(fd, header)
+            _send_file(fd, handle.fileno(), info.size)
+        offset += len(header) + info.size
+        remainder = info.size % tarfile.BLOCKSIZE
+        if remainder:
+            _write_all(fd, tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            offset += tarfile.BLOCKSIZE - remainder
+    trailer = tarfile.NUL * (tarfile.BLOCKSIZE * 2)
+    offset += len(trailer)
+    remainder = offset % tarfile.RECORDSIZE
+    if remainder:
+        trailer += tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+    _write_all(fd, trailer)
+
+
+def _add_files(tar: tarfile.TarFile, files: list[SelectedFile]) -> None:
+    for item in files:
+        with open(item.absolute, "rb") as handle:
+            info = _make_tarinfo(item.relative, os.fstat(handle.fileno()))
+            tar.addfile(info, handle)
+
+
+def _open_pigz(pigz: str, output: str) -> subprocess.Popen[bytes]:
+    import subprocess
+
+    cmd = [pigz, "-p", str(os.cpu_count() or 1)]
+    if output == "-":
+        sys.stdout.buffer.flush()
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=sys.stdout.buffer)
+    with open(output, "wb") as sink:
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=sink)
+
+
 def cmd_zip(args: argparse.Namespace) -> int:
+    import shutil
+    import tarfile
+
     selection = select_files(args)
     if selection is None or not selection.files:
         return 0
 
+    files = selection.files
     output = args.output
-    if output == "-":
-        tar = tarfile.open(fileobj=sys.stdout.buffer, mode="w:gz")
-        should_close = True
-    else:
+    if output != "-":
         output_path = Path(output)
         if output_path.parent:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-        tar = tarfile.open(output, mode="w:gz")
-        should_close = True
+        output_real = os.path.realpath(output_path)
+        files = [item for item in files if item.absolute != output_real]
+
+    pigz = shutil.which("pigz")
+    if pigz is not None:
+        proc = _open_pigz(pigz, output)
+        try:
+            try:
+                if sys.platform == "linux":
+                    _write_tar_stream(proc.stdin.fileno(), files)
+                else:
+                    with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                        _add_files(tar, files)
+            finally:
+                proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        finally:
+            proc.wait()
+        return proc.returncode
 
+    if output == "-":
+        tar = tarfile.open(fileobj=sys.stdout.buffer, mode="w:gz")
+    else:
+        tar = tarfile.open(output, mode="w:gz")
     try:
-        for item in selection.files:
-            tar.add(item.absolute, arcname=item.relative)
+        _add_files(tar, files)
     finally:
-        if should_close:
-            tar.close()
+        tar.close()
     return 0
 
 
 def cmd_code2prompt(args: argparse.Namespace) -> int:
+    import subprocess
+
     selection = select_files(args)
     if selection is None or not selection.files:
         return 0
-    cmd = ["code2prompt", *[str(item.absolute) for item in selection.files]]
+    cmd = ["code2prompt", *[item.absolute for item in selection.files]]
     return subprocess.call(cmd)
 
 
+def _copy_fds(src_fd: int, dst_fd: int) -> bool:
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError:
+        pass
+    total = 0
+    try:
+        while copied := os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK):
+            total += copied
+    except OSError:
+        return False
+    return total > 0
+
+
+def _fast_copy(src: str, dst: Path) -> None:
+    import shutil
+
+    copied = False
+    if sys.platform == "linux":
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+            try:
+                src_st = os.fstat(src_fd)
+                dst_st = os.fstat(dst_fd)
+                if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+                    raise shutil.SameFileError(
+                        f"{src!r} and {str(dst)!r} are the same file"
+                    )
+                os.ftruncate(dst_fd, 0)
+                copied = _copy_fds(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 def cmd_copy(args: argparse.Namespace) -> int:
     selection = select_files(args)
     if selection is None or not selection.files:
         return 0
 
     dest = args.dest.resolve()
-    for item in selection.files:
-        target = dest / item.relative
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(item.absolute, target)
-    return 0
+    targets = [dest / item.relative for item in selection.files]
+    errors: list[str] = []
+    failed_parents: set[Path] = set()
+    for parent in sorted({target.parent for target in targets}):
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            failed_parents.add(parent)
+            errors.append(f"Failed to create {parent}: {exc}")
+    pending = [
+        (item, target)
+        for item, target in zip(selection.files, targets)
+        if target.parent not in failed_parents
+    ]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_fast_copy, item.absolute, target)
+            for item, target in pending
+        ]
+        for (item, _), future in zip(pending, futures):
+            try:
+                future.result()
+            except OSError as exc:
+                errors.append(f"Failed to copy {item.relative}: {exc}")
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+def _timeline_line_numpy(normalized: list[float], width: int, ramp: str) -> str | None:
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        return None
+    idx = np.rint(np.asarray(normalized, dtype=np.float64) * (width - 1))
+    idx = np.clip(idx, 0, width - 1).astype(np.int64)
+    counts = np.bincount(idx, minlength=width)
+    levels = (counts / counts.max() * (len(ramp) - 1)).astype(np.int64)
+    return np.frombuffer(ramp.encode(), dtype="S1")[levels].tobytes().decode()
 
 
 def render_timeline_ascii(
     normalized: list[float], min_label: str, max_label: str, bins: int
 ) -> None:
     width = max(10, bins)
+    ramp = " .:-=+*#%@"
+    if len(normalized) >= 1024:
+        line = _timeline_line_numpy(normalized, width, ramp)
+        if line is not None:
+            print(f"{min_label} |{line}| {max_label}")
+            return
     counts = [0] * width
     for value in normalized:
         idx = int(round(value * (width - 1)))
@@ -461,7 +860,6 @@ def render_timeline_ascii(
             idx = width - 1
         counts[idx] += 1
     max_count = max(counts) if counts else 0
-    ramp = " .:-=+*#%@"
     if max_count == 0:
         line = " " * width
     else:
@@ -483,7 +881,7 @@ def cmd_timeline(args: argparse.Namespace) -> int:
         print("Width and height must be > 0.", file=sys.stderr)
         return 2
 
-    records = collect_records(root, args.filter)
+    records = collect_records(root, args.filter, args.cache)
     if not records:
         return 0
 
@@ -521,8 +919,11 @@ def cmd_timeline(args: argparse.Namespace) -> int:
     return 0
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
-    parser = build_parser()
+def parse_args(
+    argv: list[str], parser: argparse.ArgumentParser | None = None
+) -> argparse.Namespace:
+    if parser is None:
+        parser = build_parser()
     commands = {"print", "zip", "code2prompt", "ccc", "copy", "timeline"}
     if argv and argv[0] not in commands and not argv[0].startswith("-"):
         argv = ["print", *argv]
@@ -530,9 +931,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 
 def main() -> int:
-    args = parse_args(sys.argv[1:])
+    parser = build_parser()
+    args = parse_args(sys.argv[1:], parser=parser)
     if not getattr(args, "command", None):
-        build_parser().print_help()
+        parser.print_help()
         return 2
     try:
         return args.func(args)
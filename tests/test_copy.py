@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from relapse.main import main
+
+
+class CopyTests(unittest.TestCase):
+    def test_copy_into_root_keeps_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            contents = {"a.py": "print('a')\n", "docs/b.md": "# b\n"}
+            for relative, text in contents.items():
+                path = root / relative
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text)
+                os.utime(path, (1_700_000_000, 1_700_000_000))
+
+            argv = ["relapse", "copy", "--root", str(root), str(root)]
+            with mock.patch("sys.argv", argv):
+                with mock.patch("sys.stderr"):
+                    status = main()
+
+            self.assertEqual(status, 1)
+            for relative, text in contents.items():
+                self.assertEqual((root / relative).read_text(), text)
+
+    def test_copy_reports_blocked_directories_and_copies_the_rest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "root"
+            dest = Path(tmp) / "dest"
+            contents = {"a.py": "print('a')\n", "src/b.py": "print('b')\n"}
+            for relative, text in contents.items():
+                path = root / relative
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text)
+            dest.mkdir()
+            (dest / "src").write_text("not a directory\n")
+
+            argv = ["relapse", "copy", "--root", str(root), str(dest)]
+            with mock.patch("sys.argv", argv):
+                with mock.patch("sys.stderr"):
+                    status = main()
+
+            self.assertEqual(status, 1)
+            self.assertEqual((dest / "a.py").read_text(), contents["a.py"])
+            self.assertEqual((dest / "src").read_text(), "not a directory\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
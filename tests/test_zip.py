@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+import sys
+import tarfile
+import tempfile
+import unittest
+from unittest import mock
+
+from relapse.main import SelectedFile, _add_files, _write_tar_stream, main
+
+
+def write_tree(root: Path, contents: dict[str, bytes]) -> None:
+    for relative, data in contents.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+class ZipTests(unittest.TestCase):
+    def test_zip_twice_skips_its_own_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_tree(root, {"src/a.py": b"print('a')\n"})
+            output = root / "batch.tar.gz"
+
+            argv = ["relapse", "zip", "--root", str(root), "-o", str(output)]
+            with mock.patch("sys.argv", argv), mock.patch(
+                "shutil.which", return_value=None
+            ):
+                self.assertEqual(main(), 0)
+                self.assertEqual(main(), 0)
+
+            with tarfile.open(output) as tar:
+                self.assertEqual(tar.getnames(), ["src/a.py"])
+
+    @unittest.skipUnless(sys.platform == "linux", "sendfile stream is Linux-only")
+    def test_tar_stream_matches_tarfile(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            contents = {
+                "a.py": b"print('a')\n",
+                "docs/empty.md": b"",
+                "src/block.bin": b"x" * tarfile.BLOCKSIZE,
+                f"src/{'n' * 120}/long.py": os.urandom(3000),
+            }
+            write_tree(root, contents)
+            files = [
+                SelectedFile(absolute=str(root / relative), relative=relative)
+                for relative in sorted(contents)
+            ]
+
+            expected = io.BytesIO()
+            with tarfile.open(fileobj=expected, mode="w|") as tar:
+                _add_files(tar, files)
+
+            with tempfile.TemporaryFile() as handle:
+                _write_tar_stream(handle.fileno(), files)
+                handle.seek(0)
+                actual = handle.read()
+
+            self.assertEqual(actual, expected.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()